@@ -1,4 +1,5 @@
 import logging
+import logging.handlers
 import os
 from datetime import datetime
 
@@ -29,4 +30,15 @@ def setup_logger():
     logger.addHandler(file_handler)
     #logger.addHandler(console_handler)
 
-    return logger
\ No newline at end of file
+    return logger
+
+def setup_worker_logger(log_queue):
+    # Used as the initializer of the parsing process pool: worker records are sent
+    # to the parent process, which writes them with its own handlers
+    logger = logging.getLogger('basketball_scraper')
+    logger.setLevel(logging.DEBUG)
+
+    # Drop handlers inherited from the parent when the worker is forked
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
@@ -1,14 +1,31 @@
-import json
-import pandas as pd
+import csv
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import orjson
 import scraper
-from logger import setup_logger
+from logger import setup_logger, setup_worker_logger
 import asyncio
 import aiohttp
 from tqdm import tqdm
-from typing import Dict, Any, List
+from typing import Dict, Any
 from concurrent.futures import ProcessPoolExecutor
 
-logger = setup_logger()
+try:
+    import uvloop
+except ImportError:  # uvloop no está disponible en Windows
+    uvloop = None
+
+logger = logging.getLogger('basketball_scraper')
+
+GAME_COLUMNS = ['id_partido', 'jornada', 'fecha', 'hora', 'pabellon', 'publico',
+                'arbitro1', 'arbitro2', 'arbitro3',
+                'resultado_local', 'resultado_visitante',
+                'parciales_local', 'parciales_visitante']
+
+# Marca el final de la cola de resultados (None indica un partido fallido)
+_NO_MORE_RESULTS = object()
 
 def load_config(filename: str = 'config.json') -> Dict[str, Any]:
     """
@@ -22,17 +39,17 @@ def load_config(filename: str = 'config.json') -> Dict[str, Any]:
 
     Raises:
         FileNotFoundError: If the configuration file is not found.
-        json.JSONDecodeError: If there's an error decoding the JSON.
+        orjson.JSONDecodeError: If there's an error decoding the JSON.
     """
     try:
-        with open(filename, 'r') as file:
-            config = json.load(file)
+        with open(filename, 'rb') as file:
+            config = orjson.loads(file.read())
         logger.info(f"Configuración cargada exitosamente desde {filename}")
         return config
     except FileNotFoundError:
         logger.error(f"Archivo de configuración {filename} no encontrado")
         raise
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error(f"Error al decodificar JSON desde {filename}")
         raise
 
@@ -56,39 +73,127 @@ async def process_game(session: aiohttp.ClientSession, game_id: int, base_url: s
         logger.error(f'Error al procesar el partido {game_id}: {str(e)}')
         return None
 
-async def process_games(start_id: int, end_id: int, base_url: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+async def game_worker(session: aiohttp.ClientSession, game_ids: asyncio.Queue, results: asyncio.Queue,
+                      base_url: str, config: Dict[str, Any]) -> None:
+    """
+    Process games taken from a queue until a None sentinel is received.
+
+    Args:
+        session (aiohttp.ClientSession): The aiohttp client session.
+        game_ids (asyncio.Queue): The queue of game IDs to process.
+        results (asyncio.Queue): The queue where the game data (or None on failure) is put.
+        base_url (str): The base URL for the game data.
+        config (Dict[str, Any]): The configuration dictionary.
+    """
+    while True:
+        game_id = await game_ids.get()
+        if game_id is None:
+            return
+        await results.put(await process_game(session, game_id, base_url, config))
+
+async def produce_results(session: aiohttp.ClientSession, game_ids: asyncio.Queue, results: asyncio.Queue,
+                          start_id: int, end_id: int, num_workers: int, base_url: str, config: Dict[str, Any]) -> None:
     """
-    Process a range of games asynchronously.
+    Feed the game IDs to a pool of workers and signal the writer once every game is processed.
 
     Args:
+        session (aiohttp.ClientSession): The aiohttp client session.
+        game_ids (asyncio.Queue): The queue of game IDs to process.
+        results (asyncio.Queue): The queue where the workers put the game data.
         start_id (int): The starting game ID.
         end_id (int): The ending game ID.
+        num_workers (int): The number of workers to run.
         base_url (str): The base URL for the game data.
         config (Dict[str, Any]): The configuration dictionary.
+    """
+    async def feed_game_ids() -> None:
+        for game_id in range(start_id, end_id + 1):
+            await game_ids.put(game_id)
+        for _ in range(num_workers):
+            await game_ids.put(None)
+
+    await asyncio.gather(
+        feed_game_ids(),
+        *(game_worker(session, game_ids, results, base_url, config) for _ in range(num_workers))
+    )
+    await results.put(_NO_MORE_RESULTS)
+
+async def write_results(results: asyncio.Queue, total: int, player_writer: Any, game_writer: csv.DictWriter) -> int:
+    """
+    Write the game data taken from a queue to the CSV writers until the end sentinel is received.
+
+    Args:
+        results (asyncio.Queue): The queue of game data produced by the workers.
+        total (int): The total number of games, used for the progress bar.
+        player_writer (csv.writer): The writer for the player statistics rows.
+        game_writer (csv.DictWriter): The writer for the game information.
 
     Returns:
-        List[Dict[str, Any]]: A list of dictionaries containing the processed game data.
+        int: The number of games successfully processed.
     """
-    async with aiohttp.ClientSession() as session:
-        tasks = [process_game(session, game_id, base_url, config) for game_id in range(start_id, end_id + 1)]
-        results = []
-        for f in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Procesando partidos"):
-            result = await f
+    processed_games = 0
+    processed_players = 0
+    with tqdm(total=total, desc="Procesando partidos") as progress:
+        while True:
+            result = await results.get()
+            if result is _NO_MORE_RESULTS:
+                break
             if result:
-                results.append(result)
-        return results
+                player_writer.writerows(result['player_stats'])
+                game_writer.writerow(result['game_info'])
+                processed_games += 1
+                processed_players += len(result['player_stats'])
+            progress.update(1)
 
-def save_to_csv(data: List[Dict[str, Any]], output_file: str) -> None:
+    logger.info(f"Total de estadísticas de jugadores recopiladas: {processed_players}")
+    logger.info(f"Total de información de partidos recopilada: {processed_games}")
+    return processed_games
+
+async def process_games(session: aiohttp.ClientSession, start_id: int, end_id: int, base_url: str, config: Dict[str, Any],
+                        player_writer: Any, game_writer: csv.DictWriter) -> int:
     """
-    Save the processed data to a CSV file.
+    Process a range of games asynchronously, writing each game's rows as soon as it completes.
+
+    A fixed pool of `max_concurrency` workers pulls game IDs from a bounded queue and
+    pushes the results to a second queue, drained by a single writer. If either side
+    fails, the other is cancelled and the error is raised.
 
     Args:
-        data (List[Dict[str, Any]]): The data to save.
-        output_file (str): The name of the output file.
+        session (aiohttp.ClientSession): The aiohttp client session shared by the whole run.
+        start_id (int): The starting game ID.
+        end_id (int): The ending game ID.
+        base_url (str): The base URL for the game data.
+        config (Dict[str, Any]): The configuration dictionary.
+        player_writer (csv.writer): The writer for the player statistics rows.
+        game_writer (csv.DictWriter): The writer for the game information.
+
+    Returns:
+        int: The number of games successfully processed.
     """
-    df = pd.DataFrame(data)
-    df.to_csv(output_file, index=False)
-    logger.info(f'Datos guardados en {output_file}')
+    num_workers = config.get('max_concurrency', 32)
+    requests_per_second = config.get('requests_per_second', 10)
+    if requests_per_second is not None and requests_per_second > 0:
+        config['rate_limiter'] = scraper.TokenBucket(requests_per_second)
+    else:
+        logger.warning("requests_per_second no es positivo: las peticiones no tendrán límite de tasa")
+        config['rate_limiter'] = None
+    game_ids = asyncio.Queue(maxsize=2 * num_workers)
+    results = asyncio.Queue(maxsize=2 * num_workers)
+
+    producers = asyncio.create_task(produce_results(session, game_ids, results, start_id, end_id, num_workers,
+                                                    base_url, config))
+    writer = asyncio.create_task(write_results(results, end_id - start_id + 1, player_writer, game_writer))
+    try:
+        # Si el escritor falla, los trabajadores quedarían bloqueados en la cola de resultados llena:
+        # en cuanto una de las dos partes falla se cancela la otra y se propaga el error
+        await asyncio.wait({producers, writer}, return_when=asyncio.FIRST_EXCEPTION)
+        for task in (writer, producers):
+            if task.done() and task.exception() is not None:
+                raise task.exception()
+        return writer.result()
+    finally:
+        producers.cancel()
+        writer.cancel()
 
 async def main():
     config = load_config()
@@ -105,42 +210,50 @@ async def main():
 
     logger.info(f"Iniciando proceso de scraping para los partidos {start_id} a {end_id}")
 
-    results = await process_games(start_id, end_id, base_url, config)
+    # Las filas se escriben a medida que se completan los partidos, con memoria constante
+    # independientemente del rango. Las columnas ausentes en un partido quedan vacías.
+    # Se escribe en archivos temporales que solo sustituyen a los anteriores si se recopilaron
+    # datos, para no perder resultados previos si la ejecución falla o no obtiene nada.
+    players_tmp = f"{output_file}.tmp"
+    games_tmp = f"{output_file_game}.tmp"
+
+    # Los registros de los procesos de parseo se escriben desde este proceso
+    log_queue = multiprocessing.Queue()
+    log_listener = logging.handlers.QueueListener(log_queue, *logger.handlers)
+    log_listener.start()
+    try:
+        with open(players_tmp, 'w', newline='', encoding='utf-8') as players_file, \
+                open(games_tmp, 'w', newline='', encoding='utf-8') as games_file:
+            player_writer = csv.writer(players_file)
+            game_writer = csv.DictWriter(games_file, fieldnames=GAME_COLUMNS, restval='')
+            player_writer.writerow(scraper.PLAYER_COLUMNS)
+            game_writer.writeheader()
+
+            with ProcessPoolExecutor(max_workers=config.get('parse_workers'), initializer=setup_worker_logger,
+                                     initargs=(log_queue,)) as process_pool:
+                config['process_pool'] = process_pool
+                async with scraper.create_session(config) as session:
+                    processed_games = await process_games(session, start_id, end_id, base_url, config,
+                                                          player_writer, game_writer)
+
+        if processed_games:
+            os.replace(players_tmp, output_file)
+            os.replace(games_tmp, output_file_game)
+    finally:
+        log_listener.stop()
+        for path in (players_tmp, games_tmp):
+            if os.path.exists(path):
+                os.remove(path)
 
-    if not results:
-        logger.error("No se recopilaron datos. Los archivos de salida estarán vacíos.")
+    if not processed_games:
+        logger.error("No se recopilaron datos. Se conservan los archivos de salida anteriores.")
         return
 
-    all_player_stats = []
-    all_game_info = []
-
-    for result in results:
-        all_player_stats.extend(result['player_stats'])
-        all_game_info.append(result['game_info'])
-
-    logger.info(f"Total de estadísticas de jugadores recopiladas: {len(all_player_stats)}")
-    logger.info(f"Total de información de partidos recopilada: {len(all_game_info)}")
-
-    # Convertir los resultados a DataFrames
-    df_players = pd.DataFrame(all_player_stats)
-    df_games = pd.DataFrame(all_game_info)
-    
-    # Asegurar que todas las columnas estén presentes, incluso si algunos juegos no tienen todos los datos
-    columns = ['id_partido', 'jornada', 'fecha', 'hora', 'pabellon', 'publico', 
-               'arbitro1', 'arbitro2', 'arbitro3', 
-               'resultado_local', 'resultado_visitante', 
-               'parciales_local', 'parciales_visitante']
-    
-    for col in columns:
-        if col not in df_games.columns:
-            df_games[col] = ''
-
-    # Reordenar las columnas
-    df_games = df_games[columns]
-
-    # Guardar los DataFrames en archivos CSV
-    save_to_csv(df_players, output_file)
-    save_to_csv(df_games, output_file_game)
+    logger.info(f'Datos guardados en {output_file} y {output_file_game}')
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    setup_logger()
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
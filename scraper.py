@@ -1,17 +1,157 @@
 import aiohttp
 import asyncio
-from bs4 import BeautifulSoup
 import logging
+import os
+import re
+import socket
+import time
+import orjson
+from lxml import etree, html as lxml_html
+from lxml.html import HtmlElement
 from aiohttp import ClientSession
-from tenacity import retry, stop_after_attempt, wait_fixed
-from typing import Dict, List, Optional
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger('basketball_scraper')
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(5))
+# Los tiros ("4/7") se separan en anotados e intentados, los porcentajes se guardan como
+# fracción y el resto de estadísticas como enteros
+PLAYER_COLUMNS = (
+    "id_partido", "equipo", "titular", "dorsal", "nombre", "minutos", "puntos",
+    "T2_anotados", "T2_intentados", "T2 %", "T3_anotados", "T3_intentados", "T3 %",
+    "T1_anotados", "T1_intentados", "T1 %", "rebotes_defensivos", "rebotes_ofensivos",
+    "rebotes_totales", "asistencias", "robos", "perdidas", "tapones_favor",
+    "tapones_contra", "mates", "faltas_cometidas", "faltas_recibidas", "+/-", "valoración"
+)
+
+# Estadísticas de un jugador que no jugó, de "minutos" a "valoración"
+_DNP_STATS = ("00:00", 0) + (0, 0, 0.0) * 3 + (0,) * 13
+
+# Versión del formato de los datos en caché. Se incrementa cuando cambia la forma de
+# 'player_stats' o 'game_info', para que no se reutilicen entradas de un formato anterior.
+_CACHE_VERSION = 3
+
+class GameNotFound(Exception):
+    """
+    Raised when the page of a game does not exist (HTTP 404).
+
+    It is not retried, since game id ranges commonly include ids without a game.
+    """
+
+def _has_class(name: str) -> str:
+    """
+    Build an XPath predicate that matches elements having the given CSS class.
+
+    Args:
+        name (str): The CSS class name.
+
+    Returns:
+        str: The XPath predicate, equivalent to the CSS selector `.name`.
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Expresiones XPath compiladas una sola vez y reutilizadas en todas las páginas
+_XP_TEAM_HEADERS = etree.XPath(f"//div[{_has_class('cabecera_partido')}]//h4")
+_XP_STATS_TABLES = etree.XPath("//table[@data-toggle='table-estadisticas']")
+_XP_TABLE_ROWS = etree.XPath('.//tr')
+_XP_PABELLON = etree.XPath(f".//*[{_has_class('clase_mostrar1280')}]")
+
+# Todos los bloques con información del partido se obtienen en un único recorrido del árbol
+_GAME_INFO_CLASSES = ('datos_fecha', 'datos_arbitros', 'resultado', 'parciales_por_cuarto')
+_XP_GAME_INFO = etree.XPath(f"//*[{' or '.join(_has_class(name) for name in _GAME_INFO_CLASSES)}]")
+
+# Parciales por cuarto, en formato "local|visitante"
+_RE_PARCIALES = re.compile(r'(\d+)\|(\d+)')
+
+class TokenBucket:
+    """
+    Asynchronous token bucket rate limiter shared by all the requests of a run.
+
+    Tokens are refilled continuously at `rate` tokens per second up to `capacity`,
+    so concurrent tasks may burst up to `capacity` requests and are then paced at `rate`.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate (float): The number of requests allowed per second. Must be positive.
+            capacity (Optional[float]): The maximum burst size. Defaults to `rate`.
+
+        Raises:
+            ValueError: If `rate` is not positive.
+        """
+        if rate <= 0:
+            raise ValueError(f"La tasa del rate limiter debe ser positiva: {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and consume it.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+def create_session(config: Dict[str, any]) -> ClientSession:
+    """
+    Create the aiohttp client session shared by every request of a run.
+
+    The session owns a single connection pool, so DNS lookups, TCP and TLS
+    handshakes are reused across games thanks to keep-alive connections.
+    Host names are resolved asynchronously with aiodns instead of the
+    thread pool based getaddrinfo resolver.
+
+    Args:
+        config (Dict[str, any]): The configuration dictionary.
+
+    Returns:
+        ClientSession: The configured aiohttp client session.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=config.get('connection_limit', 64),
+        limit_per_host=config.get('connection_limit_per_host', 16),
+        resolver=aiohttp.AsyncResolver(),
+        use_dns_cache=True,
+        ttl_dns_cache=600,
+        family=socket.AF_INET,
+        keepalive_timeout=30
+    )
+    headers = {'User-Agent': config.get('user_agent', 'BasketballStatsScraper/1.0')}
+    return ClientSession(connector=connector, headers=headers)
+
+# Códigos HTTP que indican un fallo transitorio del servidor y merecen reintento
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def _is_transient_error(exception: BaseException) -> bool:
+    """
+    Check whether a fetch error is transient and the request should be retried.
+
+    Args:
+        exception (BaseException): The exception raised by the request.
+
+    Returns:
+        bool: True for connection errors, server disconnects, timeouts and transient HTTP statuses.
+    """
+    if isinstance(exception, aiohttp.ClientResponseError):
+        return exception.status in _TRANSIENT_STATUSES
+    return isinstance(exception, (aiohttp.ClientConnectorError, aiohttp.ServerDisconnectedError, asyncio.TimeoutError))
+
 async def fetch(session: ClientSession, url: str, game_id: int, config: Dict[str, any]) -> str:
     """
-    Fetch the HTML content of a given URL.
+    Fetch the HTML content of a given URL, retrying transient errors.
+
+    Up to `max_retries` retries are made, with exponential backoff and jitter
+    capped at `retry_delay` seconds between attempts.
 
     Args:
         session (ClientSession): The aiohttp client session.
@@ -23,18 +163,124 @@ async def fetch(session: ClientSession, url: str, game_id: int, config: Dict[str
         str: The HTML content of the page.
 
     Raises:
+        GameNotFound: If the game page does not exist.
         aiohttp.ClientResponseError: If the HTTP request fails.
     """
-    headers = {'User-Agent': config.get('user_agent', 'BasketballStatsScraper/1.0')}
-    async with session.get(url, headers=headers) as response:
-        await asyncio.sleep(config.get('rate_limit', 1))
+    retrying = AsyncRetrying(
+        retry=retry_if_exception(_is_transient_error),
+        stop=stop_after_attempt(config.get('max_retries', 3) + 1),
+        wait=wait_exponential_jitter(initial=0.5, max=config.get('retry_delay', 10)),
+        reraise=True
+    )
+    return await retrying(_fetch_once, session, url, game_id, config)
+
+async def _fetch_once(session: ClientSession, url: str, game_id: int, config: Dict[str, any]) -> str:
+    """
+    Make a single, rate limited request for the HTML content of a given URL.
+
+    Args:
+        session (ClientSession): The aiohttp client session.
+        url (str): The URL to fetch.
+        game_id (int): The ID of the game being fetched.
+        config (Dict[str, any]): The configuration dictionary.
+
+    Returns:
+        str: The HTML content of the page.
+
+    Raises:
+        GameNotFound: If the game page does not exist.
+        aiohttp.ClientResponseError: If the HTTP request fails.
+    """
+    rate_limiter = config.get('rate_limiter')
+    if rate_limiter is not None:
+        await rate_limiter.acquire()
+    async with session.get(url) as response:
+        if response.status == 404:
+            raise GameNotFound(f"El partido {game_id} no existe ({url})")
         response.raise_for_status()
         return await response.text()
 
+def _cache_path(cache_dir: str, game_id: int) -> str:
+    """
+    Build the path of the cache file for a game.
+
+    Args:
+        cache_dir (str): The cache directory.
+        game_id (int): The ID of the game.
+
+    Returns:
+        str: The path of the cache file.
+    """
+    return os.path.join(cache_dir, f"v{_CACHE_VERSION}", f"{game_id}.json")
+
+def load_cached_game(cache_dir: str, game_id: int, ttl: Optional[float] = None) -> Optional[Dict]:
+    """
+    Load the cached data of a game, if present and not expired.
+
+    Args:
+        cache_dir (str): The cache directory.
+        game_id (int): The ID of the game.
+        ttl (Optional[float]): The maximum age of the cache file in seconds. None means it never expires.
+
+    Returns:
+        Optional[Dict]: The cached game data, or None on a cache miss.
+    """
+    path = _cache_path(cache_dir, game_id)
+    try:
+        if ttl is not None and time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, 'rb') as file:
+            return orjson.loads(file.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"No se pudo leer la caché del partido {game_id}: {str(e)}")
+        return None
+
+def store_cached_game(cache_dir: str, game_id: int, data: Dict) -> None:
+    """
+    Store the data of a game in the cache.
+
+    The file is written to a temporary path and then renamed, so a concurrent
+    reader or an interrupted run never sees a partially written file.
+
+    Args:
+        cache_dir (str): The cache directory.
+        game_id (int): The ID of the game.
+        data (Dict): The game data to store.
+    """
+    path = _cache_path(cache_dir, game_id)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as file:
+            file.write(orjson.dumps(data))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"No se pudo guardar en caché el partido {game_id}: {str(e)}")
+
+def is_finished_game(game_info: Dict[str, str]) -> bool:
+    """
+    Check whether the game information includes the result of both teams.
+
+    Args:
+        game_info (Dict[str, str]): The game information extracted from the page.
+
+    Returns:
+        bool: True if both the local and visitor results are present.
+    """
+    return bool(game_info.get('resultado_local')) and bool(game_info.get('resultado_visitante'))
+
 async def get_game_data(session: ClientSession, url: str, game_id: int, config: Dict[str, any]) -> Optional[Dict]:
     """
     Extract game data from a given URL.
 
+    Games already present in the cache directory (`cache_dir`) are returned without
+    being fetched again, since the statistics of a finished game do not change. Only
+    games with a final result are cached, so games not yet played or in progress are
+    fetched again on the next run.
+    The page is parsed in the executor given as `process_pool`, if any.
+
     Args:
         session (ClientSession): The aiohttp client session.
         url (str): The URL to fetch game data from.
@@ -44,28 +290,82 @@ async def get_game_data(session: ClientSession, url: str, game_id: int, config:
     Returns:
         Optional[Dict]: A dictionary containing player stats and game info, or None if extraction fails.
     """
+    cache_dir = config.get('cache_dir')
+    if cache_dir:
+        cached = load_cached_game(cache_dir, game_id, config.get('cache_ttl'))
+        if cached is not None:
+            logger.info(f"Datos del partido {game_id} obtenidos de la caché")
+            return cached
+
     logger.info(f"Obteniendo datos para el partido {game_id} desde {url}")
     
     try:
         html = await fetch(session, url, game_id, config)
+    except GameNotFound as e:
+        logger.warning(str(e))
+        return None
     except Exception as e:
         logger.error(f"No se pudieron obtener los datos para el partido {game_id}: {str(e)}")
         return None
 
-    soup = BeautifulSoup(html, 'html.parser')
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(config.get('process_pool'), parse_game_html, html, game_id)
+    if result is None:
+        return None
+
+    if cache_dir and is_finished_game(result['game_info']):
+        store_cached_game(cache_dir, game_id, result)
+    return result
+
+def get_game_data_sync(url: str, game_id: int, config: Dict[str, any]) -> Optional[Dict]:
+    """
+    Extract game data from a given URL outside of an event loop.
 
-    game_info = extract_game_info(soup, game_id)
+    Thin wrapper over get_game_data for one-off, synchronous callers; it opens
+    its own client session, so it should not be used in a loop over many games.
 
-    team_headers = soup.select('div.cabecera_partido h4')
+    Args:
+        url (str): The URL to fetch game data from.
+        game_id (int): The ID of the game.
+        config (Dict[str, any]): The configuration dictionary.
+
+    Returns:
+        Optional[Dict]: A dictionary containing player stats and game info, or None if extraction fails.
+    """
+    async def run() -> Optional[Dict]:
+        async with create_session(config) as session:
+            return await get_game_data(session, url, game_id, config)
+
+    return asyncio.run(run())
+
+def parse_game_html(html: str, game_id: int) -> Optional[Dict]:
+    """
+    Parse the HTML of a game page into player stats and game info.
+
+    This is pure CPU work, so it is a module-level function that can be run
+    in a process pool while fetching stays on the event loop.
+
+    Args:
+        html (str): The HTML content of the game page.
+        game_id (int): The ID of the game.
+
+    Returns:
+        Optional[Dict]: A dictionary containing player stats and game info, or None if extraction fails.
+    """
+    tree = lxml_html.fromstring(html)
+
+    game_info = extract_game_info(tree, game_id)
+
+    team_headers = _XP_TEAM_HEADERS(tree)
     if len(team_headers) < 2:
         logger.error(f"No se encontraron los nombres de los equipos para el partido {game_id}")
         return None
 
-    team1 = team_headers[0].text.strip()
-    team2 = team_headers[1].text.strip()
+    team1 = team_headers[0].text_content().strip()
+    team2 = team_headers[1].text_content().strip()
     logger.info(f"Partido {game_id}: {team1} vs {team2}")
 
-    tables = soup.find_all('table', {'data-toggle': 'table-estadisticas'})
+    tables = _XP_STATS_TABLES(tree)
     if len(tables) < 2:
         logger.error(f"No se encontraron las tablas de estadísticas para el partido {game_id}")
         return None
@@ -81,111 +381,106 @@ async def get_game_data(session: ClientSession, url: str, game_id: int, config:
         'game_info': game_info
     }
 
-def extract_game_info(soup: BeautifulSoup, game_id: int) -> Dict[str, str]:
+def _first(tree: HtmlElement, xpath: etree.XPath) -> Optional[HtmlElement]:
+    """
+    Return the first element matching an XPath expression.
+
+    Args:
+        tree (HtmlElement): The element to evaluate the expression against.
+        xpath (etree.XPath): The compiled XPath expression.
+
+    Returns:
+        Optional[HtmlElement]: The first matching element, or None if there is no match.
+    """
+    matches = xpath(tree)
+    return matches[0] if matches else None
+
+def extract_game_info(tree: HtmlElement, game_id: int) -> Dict[str, str]:
     """
-    Extract game information from the BeautifulSoup object.
+    Extract game information from the parsed HTML tree.
 
     Args:
-        soup (BeautifulSoup): The BeautifulSoup object containing the parsed HTML.
+        tree (HtmlElement): The lxml element containing the parsed HTML.
         game_id (int): The ID of the game.
 
     Returns:
         Dict[str, str]: A dictionary containing extracted game information.
     """
     game_info = {'id_partido': game_id}
-    
-    header_info = soup.select_one('.datos_fecha')
-    if header_info:
-        info_text = header_info.text.strip().split('|')
+
+    sections = {name: [] for name in _GAME_INFO_CLASSES}
+    for element in _XP_GAME_INFO(tree):
+        for name in _GAME_INFO_CLASSES:
+            if name in element.classes:
+                sections[name].append(element)
+
+    if sections['datos_fecha']:
+        header_info = sections['datos_fecha'][0]
+        header_text = header_info.text_content().strip()
+        info_text = header_text.split('|')
         game_info['jornada'] = info_text[0].strip().replace('JORNADA ', '')
         game_info['fecha'] = info_text[1].strip()
         game_info['hora'] = info_text[2].strip()
-        
-        pabellon_span = header_info.select_one('.clase_mostrar1280')
-        if pabellon_span:
-            game_info['pabellon'] = pabellon_span.text.strip()
+
+        pabellon_span = _first(header_info, _XP_PABELLON)
+        if pabellon_span is not None:
+            game_info['pabellon'] = pabellon_span.text_content().strip()
         else:
             game_info['pabellon'] = info_text[3].strip() if len(info_text) > 3 else ''
 
-    public_info = soup.select_one('.datos_fecha')
-    if public_info:
-        public_text = public_info.text.strip().split('Público:')
-        if len(public_text) > 1:
-            game_info['publico'] = public_text[1].strip()
+        _, found, public_text = header_text.partition('Público:')
+        if found:
+            game_info['publico'] = public_text.strip()
 
-    referees = soup.select_one('.datos_arbitros')
-    if referees:
-        referee_list = referees.text.replace('Árb:', '').strip().split(',')
+    if sections['datos_arbitros']:
+        referee_list = sections['datos_arbitros'][0].text_content().replace('Árb:', '').strip().split(',')
         for i, ref in enumerate(referee_list[:3], start=1):
             game_info[f'arbitro{i}'] = ref.strip()
 
-    results = soup.select('.resultado')
+    results = sections['resultado']
     if len(results) == 2:
-        game_info['resultado_local'] = results[0].text.strip()
-        game_info['resultado_visitante'] = results[1].text.strip()
-
-    quarters = soup.select_one('.parciales_por_cuarto')
-    if quarters:
-        quarter_scores = quarters.text.strip().split()
-        local_scores = []
-        visitor_scores = []
-        for i in range(0, len(quarter_scores)):
-            local, visitor = quarter_scores[i].split('|')
-            local_scores.append(local)
-            visitor_scores.append(visitor)
-        game_info['parciales_local'] = ','.join(local_scores)
-        game_info['parciales_visitante'] = ','.join(visitor_scores)
+        game_info['resultado_local'] = results[0].text_content().strip()
+        game_info['resultado_visitante'] = results[1].text_content().strip()
+
+    if sections['parciales_por_cuarto']:
+        quarter_scores = _RE_PARCIALES.findall(sections['parciales_por_cuarto'][0].text_content())
+        game_info['parciales_local'] = ','.join(local for local, _ in quarter_scores)
+        game_info['parciales_visitante'] = ','.join(visitor for _, visitor in quarter_scores)
 
     return game_info
 
-def parse_table(table: BeautifulSoup, team_name: str, game_id: int) -> List[Dict[str, str]]:
+def parse_table(table: HtmlElement, team_name: str, game_id: int) -> List[Tuple]:
     """
     Parse a table containing player statistics.
 
     Args:
-        table (BeautifulSoup): The BeautifulSoup object containing the table to parse.
+        table (HtmlElement): The lxml element containing the table to parse.
         team_name (str): The name of the team.
         game_id (int): The ID of the game.
 
     Returns:
-        List[Dict[str, str]]: A list of dictionaries, each containing a player's statistics.
+        List[Tuple]: A list of rows, each containing a player's statistics in the order of PLAYER_COLUMNS.
     """
     logger.debug(f"Analizando tabla de estadísticas para el equipo {team_name}")
     players_stats = []
-    rows = table.find_all('tr')
-    
-    headers = [
-        "id_partido", "equipo", "titular", "dorsal", "nombre", "minutos", "puntos",
-        "T2", "T2 %", "T3", "T3 %", "T1", "T1 %", "rebotes_defensivos", "rebotes_ofensivos",
-        "rebotes_totales", "asistencias", "robos", "perdidas", "tapones_favor",
-        "tapones_contra", "mates", "faltas_cometidas", "faltas_recibidas", "+/-", "valoración"
-    ]
+    rows = _XP_TABLE_ROWS(table)
 
     for row in rows[2:-4]:  # Ignoramos las filas de cabecera y totales
-        cols = row.find_all('td')
-        player_data = [col.text.strip() for col in cols]
+        # Las celdas vacías se conservan para no desplazar las columnas (jugadores sin minutos)
+        player_data = [col.text_content().strip() for col in row.iterchildren('td')]
         
         if len(player_data) < 23:
             logger.warning(f"Datos incompletos para un jugador en el equipo {team_name}, partido {game_id}. Saltando...")
             continue
 
-        player_dict = create_player_dict(player_data, game_id, team_name)
-
-        # Asegurarse de que todas las claves estén presentes
-        for header in headers:
-            if header not in player_dict:
-                player_dict[header] = ""
-
-        # Ordenar el diccionario según el orden de los headers
-        ordered_dict = {key: player_dict[key] for key in headers}
-        players_stats.append(ordered_dict)
+        players_stats.append(create_player_row(player_data, game_id, team_name))
 
     logger.debug(f"Análisis de tabla completado para el equipo {team_name}. Jugadores procesados: {len(players_stats)}")
     return players_stats
 
-def create_player_dict(player_data: List[str], game_id: int, team_name: str) -> Dict[str, str]:
+def create_player_row(player_data: List[str], game_id: int, team_name: str) -> Tuple:
     """
-    Create a dictionary of player statistics from raw data.
+    Create a row of player statistics from raw data.
 
     Args:
         player_data (List[str]): Raw player data from the table.
@@ -193,56 +488,86 @@ def create_player_dict(player_data: List[str], game_id: int, team_name: str) ->
         team_name (str): The name of the team.
 
     Returns:
-        Dict[str, str]: A dictionary containing the player's statistics.
-    """
-    player_dict = {
-        "id_partido": game_id,
-        "equipo": team_name,
-        "titular": '*' if player_data[0].startswith('*') else '',
-        "dorsal": player_data[0].strip('*'),
-        "nombre": player_data[1],
-        "minutos": player_data[2],
-        "puntos": player_data[3],
-        "T2": player_data[4],
-        "T2 %": player_data[5],
-        "T3": player_data[6],
-        "T3 %": player_data[7],
-        "T1": player_data[8],
-        "T1 %": player_data[9],
-    }
+        Tuple: The player's statistics in the order of PLAYER_COLUMNS.
+    """
+    player = (
+        game_id,
+        team_name,
+        '*' if player_data[0].startswith('*') else '',
+        player_data[0].strip('*'),
+        player_data[1],
+    )
+
+    # Si el jugador no jugó (minutos vacíos), rellenar con ceros
+    if not player_data[2]:
+        return player + _DNP_STATS
+
+    # Procesar rebotes: "defensivos+ofensivos"
+    rebotes_defensivos, rebotes_ofensivos = (player_data[11].split('+') + ['0'])[:2]
+
+    return player + (
+        player_data[2],              # minutos
+        _to_int(player_data[3]),     # puntos
+        *_split_shots(player_data[4]),
+        _to_fraction(player_data[5]),
+        *_split_shots(player_data[6]),
+        _to_fraction(player_data[7]),
+        *_split_shots(player_data[8]),
+        _to_fraction(player_data[9]),
+        _to_int(rebotes_defensivos),
+        _to_int(rebotes_ofensivos),
+        _to_int(player_data[10]),    # rebotes_totales
+        _to_int(player_data[12]),    # asistencias
+        _to_int(player_data[13]),    # robos
+        _to_int(player_data[14]),    # perdidas
+        _to_int(player_data[16]),    # tapones_favor
+        _to_int(player_data[17]),    # tapones_contra
+        _to_int(player_data[18]),    # mates
+        _to_int(player_data[19]),    # faltas_cometidas
+        _to_int(player_data[20]),    # faltas_recibidas
+        _to_int(player_data[21]),    # +/-
+        _to_int(player_data[22]),    # valoración
+    )
+
+def _to_int(value: str) -> Optional[int]:
+    """
+    Convert a counting stat to an integer.
 
-    # Procesar rebotes
-    d_o = player_data[11].split('+')
-    player_dict["rebotes_defensivos"] = d_o[0] if len(d_o) > 0 else '0'
-    player_dict["rebotes_ofensivos"] = d_o[1] if len(d_o) > 1 else '0'
-    player_dict["rebotes_totales"] = player_data[10]
-
-    # Resto de estadísticas
-    player_dict.update({
-        "asistencias": player_data[12],
-        "robos": player_data[13],
-        "perdidas": player_data[14],
-        "tapones_favor": player_data[16],
-        "tapones_contra": player_data[17],
-        "mates": player_data[18],
-        "faltas_cometidas": player_data[19],
-        "faltas_recibidas": player_data[20],
-        "+/-": player_data[21],
-        "valoración": player_data[22]
-    })
-
-    # Si el jugador no jugó (minutos vacíos), rellenar con ceros manteniendo el formato
-    if not player_dict["minutos"]:
-        for key in player_dict:
-            if key in ["id_partido", "equipo", "titular", "dorsal", "nombre"]:
-                continue
-            elif key == "minutos":
-                player_dict[key] = "00:00"
-            elif key in ["T2 %", "T3 %", "T1 %"]:
-                player_dict[key] = "0%"
-            elif key in ["T2", "T3", "T1"]:
-                player_dict[key] = "0/0"
-            else:
-                player_dict[key] = "0"
-
-    return player_dict
\ No newline at end of file
+    Args:
+        value (str): The raw value, e.g. "15" or "-3".
+
+    Returns:
+        Optional[int]: The integer value, or None if it is not a number.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+def _to_fraction(value: str) -> Optional[float]:
+    """
+    Convert a percentage to a fraction.
+
+    Args:
+        value (str): The raw value, e.g. "50%".
+
+    Returns:
+        Optional[float]: The fraction, e.g. 0.5, or None if it is not a number.
+    """
+    try:
+        return float(value.rstrip('%')) / 100
+    except ValueError:
+        return None
+
+def _split_shots(value: str) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Split a shots stat into made and attempted shots.
+
+    Args:
+        value (str): The raw value, e.g. "4/7".
+
+    Returns:
+        Tuple[Optional[int], Optional[int]]: The made and attempted shots.
+    """
+    made, _, attempted = value.partition('/')
+    return _to_int(made), _to_int(attempted)